@@ -1,8 +1,10 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 import re
 
 
 class BSchoolPaperStructure(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     tldr: str = Field(description="generate a too long; didn't read summary")
     research_question: str = Field(description="research question of this paper")
     motivation: str = Field(description="motivation of this paper")
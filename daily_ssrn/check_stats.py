@@ -8,21 +8,58 @@
 - 删除重复论文条目，保留新内容 / Remove duplicate papers, keep new content
 - 根据去重后的结果决定工作流是否继续 / Decide workflow continuation based on deduplication results
 """
-import json
 import sys
 import os
-import copy
+import mmap
+import pickle
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import argparse
 
+import orjson
 
-def load_papers_data(file_path):
+# 顶层论文ID后紧跟 is_approved 字段，嵌套的作者等对象同样含有 "id"，借此区分
+# The top-level paper id is followed by is_approved; nested author objects also carry an "id"
+PAPER_ID_PATTERN = re.compile(rb'"id":\s*"([^"\\]*)",\s*"is_approved"')
+
+
+def iter_jsonl_lines(file_path):
+    """
+    通过mmap逐行读取jsonl文件，跳过空行
+    Iterate over the non-empty lines of a jsonl file through mmap
+
+    Args:
+        file_path (str): JSONL文件路径 / JSONL file path
+
+    Yields:
+        bytes: 单行原始内容 / Raw bytes of a single line
     """
-    从jsonl文件中加载完整的论文数据
-    Load complete paper data from jsonl file
+    with open(file_path, 'rb') as f:
+        # 空文件无法mmap / An empty file cannot be mmapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            end = len(mm)
+            while start < end:
+                nl = mm.find(b'\n', start)
+                if nl == -1:
+                    nl = end
+                line = mm[start:nl]
+                start = nl + 1
+                if line.strip():
+                    yield line
+
+
+def load_papers_data(file_path, fields=None):
+    """
+    从jsonl文件中加载论文数据
+    Load paper data from jsonl file
     
     Args:
         file_path (str): JSONL文件路径 / JSONL file path
+        fields (tuple): 仅保留的字段，默认保留全部 / Fields to keep, all fields by default
         
     Returns:
         list: 论文数据列表 / List of paper data
@@ -34,18 +71,79 @@ def load_papers_data(file_path):
     papers = []
     ids = set()
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    data = json.loads(line)
-                    papers.append(data)
-                    ids.add(data.get('id', ''))
+        for line in iter_jsonl_lines(file_path):
+            data = orjson.loads(line)
+            if fields is not None:
+                data = {k: data[k] for k in fields if k in data}
+            papers.append(data)
+            ids.add(data.get('id', ''))
         return papers, ids
     except Exception as e:
         print(f"Error reading {file_path}: {e}", file=sys.stderr)
         return [], set()
 
 
+def load_paper_ids(file_path):
+    """
+    加载论文ID集合，优先使用缓存文件，源文件更新后重新生成
+    Load the set of paper IDs, using the cache file unless the jsonl file is newer
+    
+    Args:
+        file_path (str): JSONL文件路径 / JSONL file path
+        
+    Returns:
+        set: 论文ID集合 / Set of paper IDs
+    """
+    if not os.path.exists(file_path):
+        return set()
+    
+    cache_path = file_path + '.ids.pkl'
+    try:
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(file_path):
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+    except Exception as e:
+        print(f"Error reading cache {cache_path}: {e}", file=sys.stderr)
+    
+    try:
+        ids = scan_paper_ids(file_path)
+    except Exception as e:
+        print(f"Error reading {file_path}: {e}", file=sys.stderr)
+        return set()
+    
+    try:
+        # 先写临时文件再替换，避免留下不完整的缓存 / Write then rename so a partial cache is never visible
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(ids, f, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"Error saving cache {cache_path}: {e}", file=sys.stderr)
+    return ids
+
+
+def scan_paper_ids(file_path):
+    """
+    仅从jsonl文件中提取论文ID，不构建完整的论文数据
+    Scan only the paper IDs from jsonl file without building full paper data
+    
+    Args:
+        file_path (str): JSONL文件路径 / JSONL file path
+        
+    Returns:
+        set: 论文ID集合 / Set of paper IDs
+    """
+    ids = set()
+    for line in iter_jsonl_lines(file_path):
+        match = PAPER_ID_PATTERN.search(line)
+        if match:
+            ids.add(match.group(1).decode('utf-8'))
+        else:
+            # 字段布局不符时退回完整解析 / Fall back to a full parse when the field layout differs
+            ids.add(orjson.loads(line).get('id', ''))
+    return ids
+
+
 def save_papers_data(papers, file_path):
     """
     保存论文数据到jsonl文件
@@ -55,13 +153,21 @@ def save_papers_data(papers, file_path):
         papers (list): 论文数据列表 / List of paper data
         file_path (str): 文件路径 / File path
     """
+    # 先写临时文件并落盘，再原子替换原文件，中途失败不会损坏原数据
+    # Write and fsync a temporary file, then atomically replace the original
+    tmp_path = file_path + '.tmp'
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            for paper in papers:
-                f.write(json.dumps(paper, ensure_ascii=False) + '\n')
+        # 大缓冲区合并小块写入，无需拼接整份内容 / A large buffer batches the writes without joining the whole payload
+        with open(tmp_path, 'wb', buffering=1 << 20) as f:
+            f.writelines(orjson.dumps(paper, option=orjson.OPT_APPEND_NEWLINE) for paper in papers)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
         return True
     except Exception as e:
         print(f"Error saving {file_path}: {e}", file=sys.stderr)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
         return False
 
 
@@ -89,33 +195,38 @@ def perform_deduplication(date):
         return "no_data"
 
     try:
-        today_papers, today_ids = load_papers_data(today_file)
+        # 判断重复只需 ID，确需改写文件时再加载完整数据 / Only ids are needed to detect duplicates
+        today_papers, today_ids = load_papers_data(today_file, fields=('id',))
         print(f"今日论文总数: {len(today_papers)} / Today's total papers: {len(today_papers)}", file=sys.stderr)
 
         if not today_papers:
             return "no_data"
 
-        # 收集历史多日 ID 集合
+        # 并行收集历史多日 ID 集合 / Collect history IDs of multiple days concurrently
+        history_paths = [
+            f"../data/{(date - timedelta(days=i)).strftime('%Y-%m-%d')}.jsonl"
+            for i in range(1, history_days + 1)
+        ]
         history_ids = set()
-        for i in range(1, history_days + 1):
-            history_date_str = (date - timedelta(days=i)).strftime("%Y-%m-%d")
-            history_file = f"../data/{history_date_str}.jsonl"
-            _, past_ids = load_papers_data(history_file)
-            history_ids.update(past_ids)
+        with ThreadPoolExecutor(max_workers=min(history_days, os.cpu_count() or 1)) as executor:
+            for past_ids in executor.map(load_paper_ids, history_paths):
+                history_ids.update(past_ids)
 
         print(f"历史{history_days}日去重库大小: {len(history_ids)} / History {history_days} days deduplication library size: {len(history_ids)}", file=sys.stderr)
 
-        duplicate_ids = today_ids & history_ids
-
-        if duplicate_ids:
-            print(f"发现 {len(duplicate_ids)} 篇历史重复论文 / Found {len(duplicate_ids)} historical duplicate papers", file=sys.stderr)
-            new_papers = [paper for paper in today_papers if paper.get('id', '') not in duplicate_ids]
+        # 直接对历史集合计数，无需先求交集 / Count against the history set directly instead of intersecting first
+        duplicate_count = sum(1 for pid in today_ids if pid in history_ids)
 
-            print(f"去重后剩余论文数: {len(new_papers)} / Remaining papers after deduplication: {len(new_papers)}", file=sys.stderr)
+        if duplicate_count:
+            remaining_count = len(today_papers) - duplicate_count
+            print(f"发现 {duplicate_count} 篇历史重复论文 / Found {duplicate_count} historical duplicate papers", file=sys.stderr)
+            print(f"去重后剩余论文数: {remaining_count} / Remaining papers after deduplication: {remaining_count}", file=sys.stderr)
 
-            if new_papers:
-                if save_papers_data(new_papers, today_file):
-                    print(f"已更新今日文件，移除 {len(duplicate_ids)} 篇重复论文 / Today's file updated, removed {len(duplicate_ids)} duplicate papers", file=sys.stderr)
+            if remaining_count:
+                full_papers, _ = load_papers_data(today_file)
+                new_papers = [paper for paper in full_papers if paper.get('id', '') not in history_ids]
+                if new_papers and save_papers_data(new_papers, today_file):
+                    print(f"已更新今日文件，移除 {duplicate_count} 篇重复论文 / Today's file updated, removed {duplicate_count} duplicate papers", file=sys.stderr)
                     return "has_new_content"
                 else:
                     print("保存去重后的数据失败 / Failed to save deduplicated data", file=sys.stderr)
@@ -151,26 +262,29 @@ def perform_merge(date):
         return "no_data"
 
     try:
-        today_papers, today_ids = load_papers_data(today_file)
-        print(f"今日论文总数: {len(today_papers)} / Today's total papers: {len(today_papers)}", file=sys.stderr)
-
-        if not today_papers:
-            return "no_data"
-
+        # 逐行解析并直接合并，不保留中间列表 / Parse line by line straight into the merged dict
+        total = 0
         merged = {}
-        for item in today_papers:
+        for line in iter_jsonl_lines(today_file):
+            item = orjson.loads(line)
+            total += 1
             item_id = item['id']
             if item_id not in merged:
-                # 创建副本并初始化 category 为列表
-                merged[item_id] = copy.deepcopy(item)
-            else:
-                merged[item_id]['category'] += item.get('category', [])
-        for v in merged.values():
-            v['category'] = list(set(v['category']))
-        result = list(merged.values())
+                # 浅拷贝条目并初始化独立的 category 列表
+                merged[item_id] = dict(item, category=[])
+            # 按首次出现的顺序合并类别，同时去重；类别至多几种，直接在列表中查找即可
+            categories = merged[item_id]['category']
+            for cat in item.get('category', []):
+                if cat not in categories:
+                    # 驻留后各条目共享同一字符串
+                    categories.append(sys.intern(cat))
+        print(f"今日论文总数: {total} / Today's total papers: {total}", file=sys.stderr)
+
+        if not merged:
+            return "no_data"
 
-        print(f"合并后论文数: {len(result)} / Merged papers count: {len(result)}", file=sys.stderr)
-        if save_papers_data(result, today_file):
+        print(f"合并后论文数: {len(merged)} / Merged papers count: {len(merged)}", file=sys.stderr)
+        if save_papers_data(merged.values(), today_file):
             print(f"已更新今日文件，合并重复条目 / Today's file updated, merged duplicate entries", file=sys.stderr)
             return "merge_success"
         else:
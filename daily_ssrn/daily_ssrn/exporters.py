@@ -0,0 +1,19 @@
+# Define your feed exporters here
+#
+# Don't forget to register your exporter in the FEED_EXPORTERS setting
+# See: https://docs.scrapy.org/en/latest/topics/feed-exports.html#feed-exporters
+
+import orjson
+from scrapy.exporters import BaseItemExporter
+
+
+class OrjsonLinesItemExporter(BaseItemExporter):
+    """使用orjson逐条写出jsonl / Write one JSON object per line with orjson"""
+
+    def __init__(self, file, **kwargs):
+        super().__init__(dont_fail=True, **kwargs)
+        self.file = file
+
+    def export_item(self, item):
+        itemdict = dict(self._get_serialized_fields(item))
+        self.file.write(orjson.dumps(itemdict, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS))
@@ -1,13 +1,47 @@
 import scrapy
 import os
-import xmltodict
 import datetime
+from lxml import etree
+
+
+def xml_to_dict(element):
+    """按 xmltodict 的规则将 lxml 元素转换为字典，保持导出数据的结构不变"""
+    result = {f'@{key}': value for key, value in element.attrib.items()}
+    list_tags = set()
+    # 与 xmltodict 一样，元素自身文本与子元素之间的文本（tail）拼接后整体去除首尾空白
+    texts = [element.text or '']
+    for child in element:
+        texts.append(child.tail or '')
+        if not isinstance(child.tag, str):
+            # 跳过注释和处理指令
+            continue
+        value = xml_to_dict(child)
+        if child.tag not in result:
+            result[child.tag] = value
+        elif child.tag in list_tags:
+            result[child.tag].append(value)
+        else:
+            result[child.tag] = [result[child.tag], value]
+            list_tags.add(child.tag)
+
+    text = ''.join(texts).strip()
+    if not result:
+        return text or None
+    if text:
+        result['#text'] = text
+    return result
 
 
 class SsrnSpider(scrapy.Spider):
     name = "ssrn"
     allowed_domains = ["ssrn.com"]
 
+    # approved_date 形如 "24 Aug 2025"，月份缩写固定，无需 strptime
+    MONTHS = {
+        'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+        'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+    }
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -17,7 +51,8 @@ class SsrnSpider(scrapy.Spider):
 
         self.target_categories = set(map(str.strip, categories.split(",")))
         self.date = datetime.datetime.strptime(date, "%Y-%m-%d")
-        self.date_str = self.date.strftime("%d %b %Y")
+        self.date_ymd = (self.date.year, self.date.month, self.date.day)
+        self._date_cache = {}
 
         self.category2id = {
             'IS': 304241,
@@ -41,43 +76,64 @@ class SsrnSpider(scrapy.Spider):
         cat_id = self.category2id[cat]
         return f"https://api.ssrn.com/content/v1/bindings/{cat_id}/papers?index={index}&count=50&sort=0"
 
+    def parse_date(self, date_str):
+        # 同一页中的日期大量重复，按原始字符串缓存解析结果
+        ymd = self._date_cache.get(date_str)
+        if ymd is None:
+            day, month, year = date_str.split()
+            ymd = (int(year), self.MONTHS[month], int(day))
+            self._date_cache[date_str] = ymd
+        return ymd
+
     def parse(self, response):
-        data = xmltodict.parse(response.text)
+        # lxml 直接解析原始字节，只转换论文节点
+        root = etree.fromstring(response.body)
         category = response.meta.get('category')
         index = response.meta.get('index')
 
-        papers = data.get("PaperResultSet", {}).get("papers", {}).get("papers", [])
+        papers = [xml_to_dict(paper) for paper in root.iterfind("papers/papers")]
 
-        # 处理日期
-        approved_dates = []
+        # 单次遍历求最早和最新的批准日期
+        earliest = latest = None
         for paper in papers:
-            approved_date = paper.get("approved_date", "").strip()
-            if approved_date:
-                approved_dates.append(datetime.datetime.strptime(approved_date, "%d %b %Y"))
+            # xml_to_dict 已去除首尾空白
+            approved_date = paper.get("approved_date")
+            if not approved_date:
+                continue
+            ymd = self.parse_date(approved_date)
+            if earliest is None or ymd < earliest:
+                earliest = ymd
+            if latest is None or ymd > latest:
+                latest = ymd
 
-        if min(approved_dates) > self.date:
+        if earliest is None:
+            # 本页没有带批准日期的论文（如已翻过最后一页），则不再爬取
+            return
+        elif earliest > self.date_ymd:
             # 如果最早的批准日期都晚于目标日期，则爬取下一页
             yield scrapy.Request(
                 url=self.build_url(category, index + 50),
                 callback=self.parse,
                 meta={'category': category, 'index': index + 50}
             )
-        elif max(approved_dates) < self.date:
+        elif latest < self.date_ymd:
             # 如果最新的批准日期都早于目标日期，则不爬取
             return
         else:
             for paper in papers:
                 paper['category'] = [category,]
 
-                approved_date = paper.get("approved_date", "").strip()
-                if approved_date != self.date_str:
+                # 复用已缓存的解析结果，按 (年, 月, 日) 比较
+                approved_date = paper.get("approved_date")
+                if not approved_date or self.parse_date(approved_date) != self.date_ymd:
                     continue
 
                 detail_url = f"https://api.ssrn.com/papers/v1/papers/{paper['id']}"
                 yield scrapy.Request(
                     url=detail_url,
                     callback=self.parse_detail,
-                    meta={'paper': paper}
+                    # 详情请求单独使用一个下载槽，不与列表翻页争抢并发
+                    meta={'paper': paper, 'download_slot': 'ssrn_detail'}
                 )
             yield scrapy.Request(
                 url=self.build_url(category, index + 50),
@@ -87,7 +143,6 @@ class SsrnSpider(scrapy.Spider):
 
     def parse_detail(self, response):
         paper = response.meta['paper']
-        detail = xmltodict.parse(response.text)
-        detail = detail.get("PaperJson", {})
-        paper['detail'] = detail
+        root = etree.fromstring(response.body)
+        paper['detail'] = xml_to_dict(root) if root.tag == "PaperJson" else {}
         yield paper